@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import {
   Card,
   CardContent,
@@ -17,8 +17,13 @@ import TrendingUpIcon from '@mui/icons-material/TrendingUp';
 import TrendingDownIcon from '@mui/icons-material/TrendingDown';
 import TrendingFlatIcon from '@mui/icons-material/TrendingFlat';
 import { useQuery } from 'react-query';
-import { fetchTrends } from '../services/api';
+import { fetchTrends, TRENDS_QUERY_OPTIONS } from '../services/api';
 import { getAvatarUrl, getProfileImageUrl } from '../config';
+import { debugLog } from '../utils/logger';
+
+// Fallback avatar URLs already prefetched, so cards sharing initials or
+// failing repeatedly do not start another download
+const prefetchedAvatarUrls = new Set();
 
 // Custom Avatar component with lazy loading
 const InstagramAvatar = ({ src, alt, imgError, onError, sx }) => {
@@ -104,15 +109,181 @@ const formatNumber = (num) => {
   }
 };
 
+// Trends indexed by username, built once per trends payload and shared by every
+// card, so each card's lookup is a Map get instead of a scan over all trends
+const trendIndexes = new WeakMap();
+
+const findAccountTrend = (trendsData, username) => {
+  let index = trendIndexes.get(trendsData);
+  
+  if (!index) {
+    index = new Map();
+    trendsData.trends.forEach(trend => {
+      // Keep the first entry per username, as Array.find would
+      if (!index.has(trend.username)) index.set(trend.username, trend);
+    });
+    trendIndexes.set(trendsData, index);
+  }
+  
+  return index.get(username);
+};
+
+// Calculate growth over roughly the last 12 hours from { time, follower_count } points
+// in a single pass, with no sorting: the latest point is compared with the newest
+// point at or before the 12-hour cutoff, or with the oldest point if none is that old
+const computeTwelveHourGrowth = (points) => {
+  // Get the time 12 hours ago
+  const twelveHoursAgo = Date.now() - 12 * 60 * 60 * 1000; // 12 hours in milliseconds
+  
+  let latest = null;
+  let referencePt = null;
+  let oldest = null;
+  
+  points.forEach(point => {
+    if (Number.isNaN(point.time)) return;
+    
+    if (!latest || point.time > latest.time) latest = point;
+    if (!oldest || point.time <= oldest.time) oldest = point;
+    
+    // If this point is older than 12 hours ago, it is a reference candidate
+    if (point.time <= twelveHoursAgo && (!referencePt || point.time > referencePt.time)) {
+      referencePt = point;
+    }
+  });
+  
+  // If we couldn't find a point older than 12 hours, try using the oldest available point
+  if (!referencePt) {
+    referencePt = oldest;
+  }
+  
+  // If we still don't have a reference point, we can't calculate growth
+  if (!latest || !referencePt) return null;
+  
+  const growth = latest.follower_count - referencePt.follower_count;
+  
+  // Calculate hourly rate based on the time difference
+  const hoursDiff = Math.max(1, (latest.time - referencePt.time) / (1000 * 60 * 60)); // In hours
+  
+  return {
+    value: growth,
+    percentage: (growth / referencePt.follower_count) * 100,
+    hourlyRate: growth / hoursDiff,
+    hoursPassed: hoursDiff
+  };
+};
+
+// Calculate follower change using logic service data if available
+const getFollowerChange = (profile, trendsData) => {
+  // First check if profile has follower_change field directly from API
+  if (profile.follower_change !== undefined && profile.follower_change !== null) {
+    return {
+      value: profile.follower_change,
+      percentage: profile.follower_count > 0 ? (profile.follower_change / profile.follower_count) * 100 : 0
+    };
+  }
+  
+  // Fall back to calculating from trends data if needed
+  if (!trendsData || !trendsData.trends) return null;
+  
+  const accountTrend = findAccountTrend(trendsData, profile.username);
+  
+  if (!accountTrend) return null;
+  
+  // Check if we have the new data structure (follower_counts array) or the old one (data_points)
+  if (accountTrend.follower_counts && accountTrend.follower_counts.length >= 2) {
+    // Get the two most recent follower counts
+    const latest = accountTrend.follower_counts[accountTrend.follower_counts.length - 1];
+    const previous = accountTrend.follower_counts[accountTrend.follower_counts.length - 2];
+    
+    const change = latest - previous;
+    
+    return {
+      value: change,
+      percentage: previous > 0 ? (change / previous) * 100 : 0
+    };
+  } 
+  // Fall back to old data structure if present
+  else if (accountTrend.data_points && accountTrend.data_points.length >= 2) {
+    // Get the two most recent data points in a single pass, without sorting
+    let latest = null;
+    let previous = null;
+    
+    accountTrend.data_points.forEach(dataPoint => {
+      const time = Date.parse(dataPoint.date);
+      if (Number.isNaN(time)) return;
+      
+      const point = { time, follower_count: dataPoint.follower_count };
+      
+      if (!latest || time > latest.time) {
+        previous = latest;
+        latest = point;
+      } else if (!previous || time > previous.time) {
+        previous = point;
+      }
+    });
+    
+    if (!latest || !previous) return null;
+    
+    const change = latest.follower_count - previous.follower_count;
+    
+    return {
+      value: change,
+      percentage: (change / previous.follower_count) * 100
+    };
+  }
+  
+  return null; // Not enough data to calculate change
+};
+
+// Calculate 12-hour follower growth
+const get12HourGrowth = (profile, trendsData) => {
+  // First check if profile has twelve_hour_change field directly from Logic Service API
+  if (profile.twelve_hour_change !== undefined && profile.twelve_hour_change !== null) {
+    return {
+      value: profile.twelve_hour_change,
+      percentage: profile.follower_count > 0 ? (profile.twelve_hour_change / profile.follower_count) * 100 : 0,
+      hourlyRate: profile.twelve_hour_change / 12,
+      hoursPassed: 12
+    };
+  }
+  
+  // We need trends data to calculate this
+  if (!trendsData || !trendsData.trends) return null;
+  
+  const accountTrend = findAccountTrend(trendsData, profile.username);
+  
+  if (!accountTrend) return null;
+  
+  // Check if we have the new data structure (timestamps & follower_counts arrays)
+  if (accountTrend.timestamps && accountTrend.follower_counts && 
+      accountTrend.timestamps.length >= 2 && accountTrend.follower_counts.length >= 2) {
+    return computeTwelveHourGrowth(
+      accountTrend.timestamps.map((timestamp, index) => ({
+        time: Date.parse(timestamp),
+        follower_count: accountTrend.follower_counts[index]
+      }))
+    );
+  }
+  // Fall back to the old data structure
+  else if (accountTrend.data_points && accountTrend.data_points.length >= 2) {
+    return computeTwelveHourGrowth(
+      accountTrend.data_points.map(point => ({
+        time: Date.parse(point.date),
+        follower_count: point.follower_count
+      }))
+    );
+  }
+  
+  return null; // Not enough data points
+};
+
 const ProfileCard = ({ profile, rank, showRank = true }) => {
   const theme = useTheme();
   const [imgError, setImgError] = useState(false);
   
   // Fetch trends data to calculate follower changes
-  const { data: trendsData } = useQuery('trends', fetchTrends, {
-    staleTime: 5 * 60 * 1000, // 5 minutes
-    refetchOnWindowFocus: false,
-  });
+  // (fetchTrends is wrapped so the query context is not taken as forceRefresh)
+  const { data: trendsData } = useQuery('trends', () => fetchTrends(), TRENDS_QUERY_OPTIONS);
   
   // Function to get the profile image URL - uses the config utility function
   const getProfileImage = () => {
@@ -148,10 +319,13 @@ const ProfileCard = ({ profile, rank, showRank = true }) => {
       resolvedUrl: getProfileImage()
     });
     
-    // Try to prefetch the fallback avatar to ensure it loads
+    // Try to prefetch the fallback avatar to ensure it loads (once per URL)
     const avatarUrl = getAvatarUrl(profile.username?.substring(0, 2).toUpperCase() || 'AI');
-    const img = new Image();
-    img.src = avatarUrl;
+    if (!prefetchedAvatarUrls.has(avatarUrl)) {
+      prefetchedAvatarUrls.add(avatarUrl);
+      const img = new Image();
+      img.src = avatarUrl;
+    }
   };
   
   // Get rank badge color
@@ -162,192 +336,6 @@ const ProfileCard = ({ profile, rank, showRank = true }) => {
     return theme.palette.primary.main;
   };
   
-  // Calculate follower change using logic service data if available
-  const getFollowerChange = () => {
-    // First check if profile has follower_change field directly from API
-    if (profile.follower_change !== undefined && profile.follower_change !== null) {
-      return {
-        value: profile.follower_change,
-        percentage: profile.follower_count > 0 ? (profile.follower_change / profile.follower_count) * 100 : 0
-      };
-    }
-    
-    // Fall back to calculating from trends data if needed
-    if (!trendsData || !trendsData.trends) return null;
-    
-    const accountTrend = trendsData.trends.find(
-      trend => trend.username === profile.username
-    );
-    
-    if (!accountTrend) return null;
-    
-    // Check if we have the new data structure (follower_counts array) or the old one (data_points)
-    if (accountTrend.follower_counts && accountTrend.follower_counts.length >= 2) {
-      // Get the two most recent follower counts
-      const latest = accountTrend.follower_counts[accountTrend.follower_counts.length - 1];
-      const previous = accountTrend.follower_counts[accountTrend.follower_counts.length - 2];
-      
-      const change = latest - previous;
-      
-      return {
-        value: change,
-        percentage: previous > 0 ? (change / previous) * 100 : 0
-      };
-    } 
-    // Fall back to old data structure if present
-    else if (accountTrend.data_points && accountTrend.data_points.length >= 2) {
-      // Get the two most recent data points
-      const sortedPoints = [...accountTrend.data_points].sort(
-        (a, b) => new Date(b.date) - new Date(a.date)
-      );
-      
-      if (sortedPoints.length < 2) return null;
-      
-      const latest = sortedPoints[0];
-      const previous = sortedPoints[1];
-      
-      const change = latest.follower_count - previous.follower_count;
-      
-      return {
-        value: change,
-        percentage: (change / previous.follower_count) * 100
-      };
-    }
-    
-    return null; // Not enough data to calculate change
-  };
-  
-  // Calculate 12-hour follower growth
-  const get12HourGrowth = () => {
-    // First check if profile has twelve_hour_change field directly from Logic Service API
-    if (profile.twelve_hour_change !== undefined && profile.twelve_hour_change !== null) {
-      return {
-        value: profile.twelve_hour_change,
-        percentage: profile.follower_count > 0 ? (profile.twelve_hour_change / profile.follower_count) * 100 : 0,
-        hourlyRate: profile.twelve_hour_change / 12,
-        hoursPassed: 12
-      };
-    }
-    
-    // We need trends data to calculate this
-    if (!trendsData || !trendsData.trends) return null;
-    
-    const accountTrend = trendsData.trends.find(
-      trend => trend.username === profile.username
-    );
-    
-    if (!accountTrend) return null;
-    
-    // Check if we have the new data structure (timestamps & follower_counts arrays)
-    if (accountTrend.timestamps && accountTrend.follower_counts && 
-        accountTrend.timestamps.length >= 2 && accountTrend.follower_counts.length >= 2) {
-      
-      // Get current time and time 12 hours ago
-      const now = new Date();
-      const twelveHoursAgo = new Date(now - 12 * 60 * 60 * 1000); // 12 hours in milliseconds
-      
-      // Create pairs of timestamps and follower counts
-      const dataPoints = accountTrend.timestamps.map((timestamp, index) => ({
-        date: timestamp,
-        follower_count: accountTrend.follower_counts[index]
-      }));
-      
-      // Sort data points by date (newest first)
-      const sortedPoints = [...dataPoints].sort(
-        (a, b) => new Date(b.date) - new Date(a.date)
-      );
-      
-      // Get the latest data point
-      const latest = sortedPoints[0];
-      
-      // Find the data point closest to 12 hours ago
-      let referencePt = null;
-      
-      for (const point of sortedPoints) {
-        const pointDate = new Date(point.date);
-        
-        // If this point is older than 12 hours ago, use it as reference
-        if (pointDate <= twelveHoursAgo) {
-          referencePt = point;
-          break;
-        }
-      }
-      
-      // If we couldn't find a point older than 12 hours, try using the oldest available point
-      if (!referencePt && sortedPoints.length >= 2) {
-        referencePt = sortedPoints[sortedPoints.length - 1];
-      }
-      
-      // If we still don't have a reference point, we can't calculate growth
-      if (!referencePt) return null;
-      
-      const growth = latest.follower_count - referencePt.follower_count;
-      
-      // Calculate hourly rate based on the time difference
-      const latestDate = new Date(latest.date);
-      const referenceDate = new Date(referencePt.date);
-      const hoursDiff = Math.max(1, (latestDate - referenceDate) / (1000 * 60 * 60)); // In hours
-      
-      return {
-        value: growth,
-        percentage: (growth / referencePt.follower_count) * 100,
-        hourlyRate: growth / hoursDiff,
-        hoursPassed: hoursDiff
-      };
-    }
-    // Fall back to the old data structure
-    else if (accountTrend.data_points && accountTrend.data_points.length >= 2) {
-      // Sort data points by date (newest first)
-      const sortedPoints = [...accountTrend.data_points].sort(
-        (a, b) => new Date(b.date) - new Date(a.date)
-      );
-      
-      // Get current time and time 12 hours ago
-      const now = new Date();
-      const twelveHoursAgo = new Date(now - 12 * 60 * 60 * 1000); // 12 hours in milliseconds
-      
-      // Get the latest data point
-      const latest = sortedPoints[0];
-      
-      // Find the data point closest to 12 hours ago
-      let referencePt = null;
-      
-      for (const point of sortedPoints) {
-        const pointDate = new Date(point.date);
-        
-        // If this point is older than 12 hours ago, use it as reference
-        if (pointDate <= twelveHoursAgo) {
-          referencePt = point;
-          break;
-        }
-      }
-      
-      // If we couldn't find a point older than 12 hours, try using the oldest available point
-      if (!referencePt && sortedPoints.length >= 2) {
-        referencePt = sortedPoints[sortedPoints.length - 1];
-      }
-      
-      // If we still don't have a reference point, we can't calculate growth
-      if (!referencePt) return null;
-      
-      const growth = latest.follower_count - referencePt.follower_count;
-      
-      // Calculate hourly rate based on the time difference
-      const latestDate = new Date(latest.date);
-      const referenceDate = new Date(referencePt.date);
-      const hoursDiff = Math.max(1, (latestDate - referenceDate) / (1000 * 60 * 60)); // In hours
-      
-      return {
-        value: growth,
-        percentage: (growth / referencePt.follower_count) * 100,
-        hourlyRate: growth / hoursDiff,
-        hoursPassed: hoursDiff
-      };
-    }
-    
-    return null; // Not enough data points
-  };
-  
   // Get 24-hour growth data directly from Logic Service
   const get24HourGrowth = () => {
     // Check if profile has twenty_four_hour_change field directly from Logic Service API
@@ -378,56 +366,62 @@ const ProfileCard = ({ profile, rank, showRank = true }) => {
     return null;
   };
   
-  // Get follower change data from the API (direct from profile.follower_change)
-  let followerChange = null;
-  
-  // IMPORTANT: Always use the direct value from the API if available
-  if (profile.follower_change !== undefined && profile.follower_change !== null) {
-    // Ensure follower_change is converted to a number for proper comparison
-    const changeValue = Number(profile.follower_change);
-    followerChange = {
-      value: changeValue,
-      percentage: profile.follower_count > 0 ? (changeValue / profile.follower_count) * 100 : 0
-    };
-    console.log(`DEBUG: Using follower_change=${changeValue} for ${profile.username}`);
-  } 
-  // Fallback to calculated value from trends if needed
-  else {
-    // Try to calculate from trend data if available
-    const calculatedChange = getFollowerChange();
-    if (calculatedChange) {
-      followerChange = calculatedChange;
-      console.log(`DEBUG: Using calculated follower_change=${calculatedChange.value} for ${profile.username}`);
-    }
-    // Last resort - set to zero for new accounts with no history
-    else {
+  // Derive follower change and 12-hour growth once per profile or trends update,
+  // not on every render (e.g. when an image load error updates state)
+  const { followerChange, twelveHourGrowth } = useMemo(() => {
+    // Get follower change data from the API (direct from profile.follower_change)
+    let followerChange = null;
+    
+    // IMPORTANT: Always use the direct value from the API if available
+    if (profile.follower_change !== undefined && profile.follower_change !== null) {
+      // Ensure follower_change is converted to a number for proper comparison
+      const changeValue = Number(profile.follower_change);
       followerChange = {
-        value: 0,
-        percentage: 0
+        value: changeValue,
+        percentage: profile.follower_count > 0 ? (changeValue / profile.follower_count) * 100 : 0
       };
-      console.log(`DEBUG: No follower change data available for ${profile.username}, using zero`);
+      debugLog(`DEBUG: Using follower_change=${changeValue} for ${profile.username}`);
+    } 
+    // Fallback to calculated value from trends if needed
+    else {
+      // Try to calculate from trend data if available
+      const calculatedChange = getFollowerChange(profile, trendsData);
+      if (calculatedChange) {
+        followerChange = calculatedChange;
+        debugLog(`DEBUG: Using calculated follower_change=${calculatedChange.value} for ${profile.username}`);
+      }
+      // Last resort - set to zero for new accounts with no history
+      else {
+        followerChange = {
+          value: 0,
+          percentage: 0
+        };
+        debugLog(`DEBUG: No follower change data available for ${profile.username}, using zero`);
+      }
     }
-  }
-  
-  // Get 12-hour growth data
-  let twelveHourGrowth = get12HourGrowth();
-  
-  // If we don't have real 12-hour growth data, use reasonable defaults
-  if (!twelveHourGrowth) {
-    // For 12-hour growth, use the same value as the follower change if available
-    // This is not perfect but it's real data rather than fabricated data
     
-    let value = followerChange?.value || 0;
-    const hourlyRate = value / 12;
+    // Get 12-hour growth data
+    let twelveHourGrowth = get12HourGrowth(profile, trendsData);
     
-    twelveHourGrowth = {
-      value: value,
-      percentage: profile.follower_count > 0 ? (value / profile.follower_count) * 100 : 0,
-      hourlyRate: hourlyRate,
-      hoursPassed: 12
-    };
-    console.log(`No 12-hour growth data for ${profile.username}, using simple follower change: ${value}`);
-  }
+    // If we don't have real 12-hour growth data, use reasonable defaults
+    if (!twelveHourGrowth) {
+      // For 12-hour growth, use the same value as the follower change if available
+      // This is not perfect but it's real data rather than fabricated data
+      
+      let value = followerChange?.value || 0;
+      const hourlyRate = value / 12;
+      
+      twelveHourGrowth = {
+        value: value,
+        percentage: profile.follower_count > 0 ? (value / profile.follower_count) * 100 : 0,
+        hourlyRate: hourlyRate,
+        hoursPassed: 12
+      };
+      debugLog(`No 12-hour growth data for ${profile.username}, using simple follower change: ${value}`);
+    }
+    
+    return { followerChange, twelveHourGrowth };
+  }, [profile, trendsData]);
   
   // Get 24-hour growth data
   let twentyFourHourGrowth = get24HourGrowth();
@@ -55,6 +55,12 @@ export const LOGIC_API = {
 export const IMAGE_ROUTE = '/images';
 export const DATA_IMAGE_PATH = '/data/image_cache';
 
+// Image references that may be routed through IMAGE_ROUTE. Only plain
+// hash/ID characters are accepted, so values containing "/" or ".." can
+// never produce a path outside the images endpoint
+const CACHED_IMAGE_PATTERN = /^(?:md5|db):([\w-]+)$/;
+const IMAGE_ID_PATTERN = /^[\w-]+(?:\.\w+)?$/;
+
 /**
  * Generate a UI avatar URL for fallback images
  * @param {string} name - The name to use for the avatar (defaults to 'AI')
@@ -76,19 +82,12 @@ export const getProfileImageUrl = (profileImgUrl, username) => {
     return getAvatarUrl(username);
   }
   
-  // Extract hash if using md5: or db: prefix
-  if (profileImgUrl && (profileImgUrl.includes('md5:') || profileImgUrl.includes('db:'))) {
-    // This is a cached image, extract the hash
-    let hash;
-    if (profileImgUrl.includes('md5:')) {
-      hash = profileImgUrl.replace('md5:', '');
-    } else {
-      hash = profileImgUrl.replace('db:', '');
-    }
-    
+  // Cached image references carry an md5: or db: prefix before the hash
+  const cachedMatch = CACHED_IMAGE_PATTERN.exec(profileImgUrl);
+  if (cachedMatch) {
     // Try using the images endpoint first (connects to database)
-    return `${IMAGE_ROUTE}/${hash}.jpg`;
-  } else if (profileImgUrl && profileImgUrl.startsWith('http')) {
+    return `${IMAGE_ROUTE}/${cachedMatch[1]}.jpg`;
+  } else if (profileImgUrl.startsWith('http')) {
     // This is a direct URL from Instagram or the Logic Service
     
     // Try to use the image directly first - most modern browsers support CORS now
@@ -98,7 +97,7 @@ export const getProfileImageUrl = (profileImgUrl, username) => {
     // For better security and to avoid CORS issues, we'll proxy the image through our backend
     // const encodedUrl = encodeURIComponent(profileImgUrl);
     // return `/api/proxy-image?url=${encodedUrl}`;
-  } else if (profileImgUrl && !profileImgUrl.includes(':')) {
+  } else if (IMAGE_ID_PATTERN.test(profileImgUrl)) {
     // This might be a simple ID or hash from the Logic Service
     // We'll route it through our image endpoint
     return `${IMAGE_ROUTE}/${profileImgUrl}`;
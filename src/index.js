@@ -6,6 +6,7 @@ import App from './App';
 import { QueryClient, QueryClientProvider } from 'react-query';
 import { BrowserRouter } from 'react-router-dom';
 import { LOGIC_SERVICE_URL, SCRAPER_API_URL } from './config';
+import { fetchTrends, TRENDS_QUERY_OPTIONS } from './services/api';
 
 // Log environment configuration
 console.log('==== Environment Configuration ====');
@@ -25,6 +26,10 @@ const queryClient = new QueryClient({
   },
 });
 
+// Start loading trends in the background right away. Every ProfileCard and the
+// Trends page read them, so they are usually cached before the first card mounts
+queryClient.prefetchQuery('trends', () => fetchTrends(), TRENDS_QUERY_OPTIONS);
+
 const root = createRoot(document.getElementById('root'));
 root.render(
   <React.StrictMode>
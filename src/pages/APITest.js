@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import {
   Box,
   Typography,
@@ -99,6 +99,11 @@ const APITest = () => {
     }
   };
 
+  // Serialize the response and diagnostics only when they change, not on every
+  // keystroke in the URL field
+  const dataJson = useMemo(() => JSON.stringify(data, null, 2), [data]);
+  const diagnosticJson = useMemo(() => JSON.stringify(diagnosticInfo, null, 2), [diagnosticInfo]);
+
   return (
     <Box>
       <Typography variant="h4" component="h1" sx={{ fontWeight: 'bold', mb: 3 }}>
@@ -221,7 +226,7 @@ const APITest = () => {
             whiteSpace: 'pre-wrap',
             wordBreak: 'break-word'
           }}>
-            {JSON.stringify(data, null, 2)}
+            {dataJson}
           </pre>
         </Paper>
       )}
@@ -239,7 +244,7 @@ const APITest = () => {
           borderRadius: '4px',
           fontSize: '0.8rem'
         }}>
-          {JSON.stringify(diagnosticInfo, null, 2)}
+          {diagnosticJson}
         </pre>
       </Paper>
     </Box>
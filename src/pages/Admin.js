@@ -102,10 +102,29 @@ const Admin = () => {
     refetchInterval: 30000, // Refresh every 30 seconds
   });
   
+  // Drop an account from a cached list in place instead of re-fetching the
+  // whole list; the regular refetch interval reconciles with the server.
+  // Demo-mode responses mean the server call failed, so the list is re-fetched
+  // instead and the account stays visible
+  const updateCachedList = (data, queryKey, listKey, username) => {
+    if (data && data.demo) {
+      queryClient.invalidateQueries(queryKey);
+      return;
+    }
+    queryClient.setQueryData(queryKey, (current) => {
+      if (!current || !Array.isArray(current[listKey])) return current;
+      return {
+        ...current,
+        [listKey]: current[listKey].filter(account => account.username !== username),
+      };
+    });
+  };
+
   // Mutation for approving accounts
   const approveMutation = useMutation(approveAccount, {
-    onSuccess: (data) => {
-      queryClient.invalidateQueries('pendingAccounts');
+    onSuccess: (data, username) => {
+      updateCachedList(data, 'pendingAccounts', 'pending', username);
+      // The tracked entry is built server-side, so only that list is re-fetched
       queryClient.invalidateQueries('trackedAccounts');
       setNotification({
         open: true,
@@ -117,8 +136,8 @@ const Admin = () => {
   
   // Mutation for rejecting accounts
   const rejectMutation = useMutation(rejectAccount, {
-    onSuccess: (data) => {
-      queryClient.invalidateQueries('pendingAccounts');
+    onSuccess: (data, username) => {
+      updateCachedList(data, 'pendingAccounts', 'pending', username);
       setNotification({
         open: true,
         message: `Account ${data.message}`,
@@ -129,8 +148,8 @@ const Admin = () => {
   
   // Mutation for removing accounts
   const removeMutation = useMutation(removeAccount, {
-    onSuccess: (data) => {
-      queryClient.invalidateQueries('trackedAccounts');
+    onSuccess: (data, username) => {
+      updateCachedList(data, 'trackedAccounts', 'accounts', username);
       setNotification({
         open: true,
         message: `Account ${data.message}`,
@@ -182,11 +201,12 @@ const Admin = () => {
     setNotification({ ...notification, open: false });
   };
   
-  // Filter tracked accounts based on search term
+  // Filter tracked accounts based on search term (lower-cased once, not per account)
+  const normalizedSearch = searchTerm.toLowerCase();
   const filteredTrackedAccounts = trackedData?.accounts?.filter(account => {
-    if (!searchTerm) return true;
-    return account.username.toLowerCase().includes(searchTerm.toLowerCase()) ||
-           (account.submitter && account.submitter.toLowerCase().includes(searchTerm.toLowerCase()));
+    if (!normalizedSearch) return true;
+    return account.username.toLowerCase().includes(normalizedSearch) ||
+           (account.submitter && account.submitter.toLowerCase().includes(normalizedSearch));
   }) || [];
   
   // Login form
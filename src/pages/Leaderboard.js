@@ -1,5 +1,5 @@
-import React, { useState, useEffect } from 'react';
-import { useQuery } from 'react-query';
+import React, { useState, useEffect, useMemo } from 'react';
+import { useQuery, useQueryClient } from 'react-query';
 import {
   Box,
   Typography,
@@ -21,10 +21,12 @@ import { useTheme } from '@mui/material/styles';
 import SearchIcon from '@mui/icons-material/Search';
 import RefreshIcon from '@mui/icons-material/Refresh';
 import BugReportIcon from '@mui/icons-material/BugReport';
-import { fetchLeaderboard, fetchTrends } from '../services/api';
-import axios from 'axios';
-import { API_ENDPOINTS } from '../config';
+import { fetchLeaderboard, fetchTrends, requestScrape } from '../services/api';
 import ProfileCard from '../components/ProfileCard';
+import { DEBUG_LOGGING } from '../utils/logger';
+
+// How often the leaderboard polls for new data
+const LEADERBOARD_REFRESH_INTERVAL = 20 * 1000; // 20 seconds
 
 const Leaderboard = () => {
   const [searchTerm, setSearchTerm] = useState('');
@@ -87,18 +89,25 @@ const Leaderboard = () => {
     }
   };
 
+  const queryClient = useQueryClient();
+  
   // Fetch leaderboard data using the API client (now with fallback mechanisms)
-  const { data, isLoading, isError, error, refetch } = useQuery(
+  const { data, isLoading, isError, error } = useQuery(
     'leaderboard',
-    fetchLeaderboard,  // Using the fetchLeaderboard function from api.js
+    () => fetchLeaderboard(),  // Wrapped so the query context is not taken as forceRefresh
     { 
-      staleTime: 15 * 1000, // 15 seconds
-      refetchInterval: 20 * 1000, // Auto-refresh every 20 seconds
+      // Data stays fresh for the whole polling interval, so remounts and window
+      // focus reuse the cached leaderboard instead of refetching between polls
+      staleTime: LEADERBOARD_REFRESH_INTERVAL,
+      refetchInterval: LEADERBOARD_REFRESH_INTERVAL,
       refetchIntervalInBackground: true, // Refresh even when tab is not active
       retry: 3,  // Increased to 3 retries
       retryDelay: (attemptIndex) => Math.min(1000 * 2 ** attemptIndex, 30000), // Exponential backoff
       onError: (err) => console.error("Query error:", err),
       onSuccess: (data) => {
+        // Per-profile logging runs on every 20 second refresh, so it is debug-only
+        if (!DEBUG_LOGGING) return;
+        
         console.log("Leaderboard data received:", data);
         if (data && data.leaderboard) {
           // Log follower change values for debugging
@@ -121,10 +130,16 @@ const Leaderboard = () => {
     setIsRefreshing(true);
     // Use forceRefresh parameter to get fresh data
     try {
-      const freshData = await fetchLeaderboard(true);
-      await fetchTrends(true);
-      // Force a refetch of the leaderboard data in react-query
-      await refetch();
+      // Fetch leaderboard and trends concurrently rather than one after another
+      const [freshLeaderboard, freshTrends] = await Promise.all([
+        fetchLeaderboard(true),
+        fetchTrends(true)
+      ]);
+      
+      // Store the fresh results in the query cache instead of fetching the
+      // leaderboard a second time through refetch()
+      queryClient.setQueryData('leaderboard', freshLeaderboard);
+      queryClient.setQueryData('trends', freshTrends);
     } catch (error) {
       console.error("Error refreshing data:", error);
     }
@@ -140,16 +155,16 @@ const Leaderboard = () => {
     
     try {
       // Call the scrape endpoint to trigger data collection
-      const response = await axios.post(API_ENDPOINTS.scrape);
+      const scrapeData = await requestScrape();
       
       // Set the result for display
       setScrapeResult({
-        success: response.data.success,
-        message: response.data.message || "Scrape operation completed.",
+        success: scrapeData.success,
+        message: scrapeData.message || "Scrape operation completed.",
         timestamp: new Date().toISOString()
       });
       
-      console.log("Scrape operation triggered:", response.data);
+      console.log("Scrape operation triggered:", scrapeData);
       
       // Wait 5 seconds for the scrape to collect new data, then refresh
       setTimeout(async () => {
@@ -248,11 +263,24 @@ const Leaderboard = () => {
     return date.toLocaleString();
   };
   
+  // Lower-case the searchable fields once per data refresh instead of on every keystroke
+  const searchIndex = useMemo(() => (data?.leaderboard || []).map(profile => ({
+    profile,
+    username: profile.username.toLowerCase(),
+    bio: profile.bio ? profile.bio.toLowerCase() : ''
+  })), [data]);
+  
   // Filter leaderboard data based on search term
-  const filteredLeaderboard = data?.leaderboard.filter(profile => 
-    profile.username.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    (profile.bio && profile.bio.toLowerCase().includes(searchTerm.toLowerCase()))
-  ) || [];
+  const normalizedSearch = searchTerm.toLowerCase();
+  const filteredLeaderboard = searchIndex
+    .filter(entry => entry.username.includes(normalizedSearch) || entry.bio.includes(normalizedSearch))
+    .map(entry => entry.profile);
+  
+  // Serialize the direct API response once per response rather than on every render
+  const directDataJson = useMemo(
+    () => (directData ? JSON.stringify(directData, null, 2) : ''),
+    [directData]
+  );
   
   // Calculate pagination
   const totalPages = Math.ceil(filteredLeaderboard.length / profilesPerPage);
@@ -459,7 +487,7 @@ const Leaderboard = () => {
                 p: 2,
                 borderRadius: 1
               }}>
-                {JSON.stringify(directData, null, 2)}
+                {directDataJson}
               </pre>
             </Box>
           )}
@@ -11,12 +11,33 @@ import {
   Divider,
   InputAdornment,
 } from '@mui/material';
-import { useMutation } from 'react-query';
+import { useMutation, useQueryClient } from 'react-query';
 import { submitAccount } from '../services/api';
 import InstagramIcon from '@mui/icons-material/Instagram';
 import PersonIcon from '@mui/icons-material/Person';
 
+// Instagram usernames: 3-30 letters, numbers, periods or underscores
+const USERNAME_PATTERN = /^[a-z0-9_.]{3,30}$/i;
+
+// Lower-cased usernames already on the leaderboard, built once per cached
+// leaderboard payload so each submission is checked with a single Set lookup
+const trackedUsernameSets = new WeakMap();
+
+const getTrackedUsernames = (leaderboardData) => {
+  if (!leaderboardData || !Array.isArray(leaderboardData.leaderboard)) return null;
+  
+  if (!trackedUsernameSets.has(leaderboardData)) {
+    trackedUsernameSets.set(
+      leaderboardData,
+      new Set(leaderboardData.leaderboard.map(profile => profile.username.toLowerCase()))
+    );
+  }
+  return trackedUsernameSets.get(leaderboardData);
+};
+
 const SubmitAccount = () => {
+  const queryClient = useQueryClient();
+  
   // Form state
   const [username, setUsername] = useState('');
   const [submitter, setSubmitter] = useState('');
@@ -65,6 +86,17 @@ const SubmitAccount = () => {
       setError('Username is required');
       return;
     }
+    if (!USERNAME_PATTERN.test(cleanedUsername)) {
+      setError('Username must be 3-30 characters using only letters, numbers, periods and underscores');
+      return;
+    }
+    
+    // Skip the request when the account is already on the cached leaderboard
+    const trackedUsernames = getTrackedUsernames(queryClient.getQueryData('leaderboard'));
+    if (trackedUsernames && trackedUsernames.has(cleanedUsername.toLowerCase())) {
+      setError(`@${cleanedUsername} is already on the leaderboard`);
+      return;
+    }
     
     // Submit to API
     submitMutation.mutate({
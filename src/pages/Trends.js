@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import { useQuery } from 'react-query';
 import {
   Box,
@@ -34,7 +34,7 @@ import {
   Legend,
 } from 'chart.js';
 import { Line } from 'react-chartjs-2';
-import { fetchTrends } from '../services/api';
+import { fetchTrends, TRENDS_QUERY_OPTIONS } from '../services/api';
 
 // Register ChartJS components
 ChartJS.register(
@@ -47,6 +47,111 @@ ChartJS.register(
   Legend
 );
 
+// Length of each selectable timeframe in milliseconds ('all' has no cutoff)
+const HOUR_MS = 60 * 60 * 1000;
+const TIMEFRAME_MS = {
+  '6h': 6 * HOUR_MS,
+  '12h': 12 * HOUR_MS,
+  '1d': 24 * HOUR_MS,
+  '1w': 7 * 24 * HOUR_MS,
+  '1m': 30 * 24 * HOUR_MS, // ~1 month
+};
+
+// Human-readable span of each timeframe, used in the chart and rankings captions
+const TIMEFRAME_LABELS = {
+  '6h': '6 hours',
+  '12h': '12 hours',
+  '1d': '24 hours',
+  '1w': '7 days',
+  '1m': '30 days',
+};
+
+// Latest follower count recorded for an account (0 when it has no data yet)
+const latestFollowerCount = (account) => (
+  account.follower_counts && account.follower_counts.length > 0
+    ? account.follower_counts[account.follower_counts.length - 1]
+    : 0
+);
+
+// Return the n highest-scoring items, highest first, without sorting or mutating
+// the whole list; n is small, so a bounded insertion into the result is enough
+const topN = (items, n, score) => {
+  const top = [];
+  
+  items.forEach(item => {
+    const value = score(item);
+    if (top.length === n && value <= top[top.length - 1].value) return;
+    
+    let index = top.length;
+    while (index > 0 && top[index - 1].value < value) index--;
+    top.splice(index, 0, { item, value });
+    if (top.length > n) top.pop();
+  });
+  
+  return top.map(entry => entry.item);
+};
+
+// Colors for chart lines, cycled when more accounts are shown
+const CHART_COLORS = [
+  'rgb(255, 99, 132)',
+  'rgb(54, 162, 235)',
+  'rgb(255, 206, 86)',
+  'rgb(75, 192, 192)',
+  'rgb(153, 102, 255)',
+  'rgb(255, 159, 64)',
+  'rgb(199, 199, 199)',
+  'rgb(83, 102, 255)',
+  'rgb(40, 159, 64)',
+  'rgb(210, 99, 132)',
+];
+
+// Shared formatter for tooltip follower counts
+const FOLLOWER_COUNT_FORMAT = new Intl.NumberFormat();
+
+// Chart options are static, so they are built once and passed to every render
+const CHART_OPTIONS = {
+  responsive: true,
+  maintainAspectRatio: false,
+  plugins: {
+    legend: {
+      position: 'top',
+    },
+    title: {
+      display: true,
+      text: 'Follower Count Trends',
+    },
+    tooltip: {
+      callbacks: {
+        label: function(context) {
+          let label = context.dataset.label || '';
+          if (label) {
+            label += ': ';
+          }
+          if (context.parsed.y !== null) {
+            label += FOLLOWER_COUNT_FORMAT.format(context.parsed.y);
+          }
+          return label + ' followers';
+        }
+      }
+    }
+  },
+  scales: {
+    y: {
+      beginAtZero: false,
+      ticks: {
+        callback: function(value) {
+          if (value >= 1000000) {
+            return (value / 1000000).toFixed(1) + 'M';
+          } else if (value >= 1000) {
+            return (value / 1000).toFixed(1) + 'K';
+          }
+          return value;
+        }
+      }
+    }
+  },
+};
+
 const Trends = () => {
   const [selectedAccounts, setSelectedAccounts] = useState([]);
   const [searchValue, setSearchValue] = useState('');
@@ -57,25 +162,16 @@ const Trends = () => {
   // Fetch trend data
   const { data, isLoading, isError, error } = useQuery(
     'trends',
-    fetchTrends,
-    { staleTime: 5 * 60 * 1000 } // 5 minutes
+    () => fetchTrends(),
+    TRENDS_QUERY_OPTIONS
   );
   
   // Set default top 5 accounts on initial load
   useEffect(() => {
     if (data && data.trends && selectedAccounts.length === 0) {
-      const topAccounts = data.trends
-        .sort((a, b) => {
-          // Get the latest follower count for each account
-          const aLatest = a.follower_counts && a.follower_counts.length > 0 
-            ? a.follower_counts[a.follower_counts.length - 1] 
-            : 0;
-          const bLatest = b.follower_counts && b.follower_counts.length > 0 
-            ? b.follower_counts[b.follower_counts.length - 1] 
-            : 0;
-          return bLatest - aLatest;
-        })
-        .slice(0, 5)
+      // Pick the five largest accounts by latest follower count; data.trends is
+      // the shared query cache, so it must not be sorted in place
+      const topAccounts = topN(data.trends, 5, latestFollowerCount)
         .map(account => account.username);
       
       setSelectedAccounts(topAccounts);
@@ -110,40 +206,22 @@ const Trends = () => {
     }
   };
   
+  // Cutoff for the selected timeframe, computed once per render (null means no cutoff)
+  const timeframeCutoff = TIMEFRAME_MS[timeframe] !== undefined
+    ? Date.now() - TIMEFRAME_MS[timeframe]
+    : null;
+  
   // Filter data points based on selected timeframe - this is no longer used directly
   // but is kept for reference and potential future use
   const filterDataPointsByTimeframe = (timestamps, values) => {
-    if (timeframe === 'all' || !timestamps || timestamps.length === 0 || !values || values.length === 0) {
+    if (timeframeCutoff === null || !timestamps || timestamps.length === 0 || !values || values.length === 0) {
       return { timestamps, values };
     }
     
-    const now = new Date();
-    let cutoffDate;
-    
-    switch (timeframe) {
-      case '6h':
-        cutoffDate = new Date(now - 6 * 60 * 60 * 1000); // 6 hours ago
-        break;
-      case '12h':
-        cutoffDate = new Date(now - 12 * 60 * 60 * 1000); // 12 hours ago
-        break;
-      case '1d':
-        cutoffDate = new Date(now - 24 * 60 * 60 * 1000); // 1 day ago
-        break;
-      case '1w':
-        cutoffDate = new Date(now - 7 * 24 * 60 * 60 * 1000); // 1 week ago
-        break;
-      case '1m':
-        cutoffDate = new Date(now - 30 * 24 * 60 * 60 * 1000); // ~1 month ago
-        break;
-      default:
-        return { timestamps, values };
-    }
-    
     // Filter and keep indices
     const filteredIndices = timestamps
-      .map((date, index) => ({ date: new Date(date), index }))
-      .filter(item => item.date >= cutoffDate)
+      .map((date, index) => ({ time: Date.parse(date), index }))
+      .filter(item => item.time >= timeframeCutoff)
       .map(item => item.index);
     
     // Use indices to filter both arrays
@@ -157,32 +235,9 @@ const Trends = () => {
   const getTimeframeDates = () => {
     if (!data || !data.dates || data.dates.length === 0) return [];
     
-    if (timeframe === 'all') return data.dates;
-    
-    const now = new Date();
-    let cutoffDate;
-    
-    switch (timeframe) {
-      case '6h':
-        cutoffDate = new Date(now - 6 * 60 * 60 * 1000);
-        break;
-      case '12h':
-        cutoffDate = new Date(now - 12 * 60 * 60 * 1000);
-        break;
-      case '1d':
-        cutoffDate = new Date(now - 24 * 60 * 60 * 1000);
-        break;
-      case '1w':
-        cutoffDate = new Date(now - 7 * 24 * 60 * 60 * 1000);
-        break;
-      case '1m':
-        cutoffDate = new Date(now - 30 * 24 * 60 * 60 * 1000);
-        break;
-      default:
-        return data.dates;
-    }
+    if (timeframeCutoff === null) return data.dates;
     
-    return data.dates.filter(dateStr => new Date(dateStr) >= cutoffDate);
+    return data.dates.filter(dateStr => Date.parse(dateStr) >= timeframeCutoff);
   };
   
   // Prepare chart data
@@ -192,7 +247,7 @@ const Trends = () => {
     // If no accounts selected, use the top 5
     const accountsToShow = selectedAccounts.length > 0
       ? selectedAccounts
-      : data.trends.slice(0, 5).map(account => account.username);
+      : topN(data.trends, 5, latestFollowerCount).map(account => account.username);
     
     // Filter trends for selected accounts
     const filteredTrends = data.trends.filter(trend => 
@@ -205,29 +260,22 @@ const Trends = () => {
     // If no dates match the timeframe, return null
     if (timeframeDates.length === 0) return null;
     
-    // Colors for chart lines
-    const colors = [
-      'rgb(255, 99, 132)',
-      'rgb(54, 162, 235)',
-      'rgb(255, 206, 86)',
-      'rgb(75, 192, 192)',
-      'rgb(153, 102, 255)',
-      'rgb(255, 159, 64)',
-      'rgb(199, 199, 199)',
-      'rgb(83, 102, 255)',
-      'rgb(40, 159, 64)',
-      'rgb(210, 99, 132)',
-    ];
-    
     // Prepare datasets
     const datasets = filteredTrends.map((trend, index) => {
       const points = [];
       
+      // Index this account's timestamps once so each date lookup is a Map get
+      // rather than an indexOf scan (keeps the first index, as indexOf would)
+      const timestampIndex = new Map();
+      (trend.timestamps || []).forEach((timestamp, i) => {
+        if (!timestampIndex.has(timestamp)) timestampIndex.set(timestamp, i);
+      });
+      
       // Adapt to the new data structure from the microservice
       // For each date in the timeframe, find the corresponding follower count
       timeframeDates.forEach(date => {
         // Get index of this date in the timestamps array
-        const dateIndex = trend.timestamps ? trend.timestamps.indexOf(date) : -1;
+        const dateIndex = timestampIndex.has(date) ? timestampIndex.get(date) : -1;
         
         // If the date exists in timestamps, use the corresponding follower count
         if (dateIndex >= 0 && trend.follower_counts && dateIndex < trend.follower_counts.length) {
@@ -241,8 +289,8 @@ const Trends = () => {
       return {
         label: `@${trend.username}`,
         data: points,
-        borderColor: colors[index % colors.length],
-        backgroundColor: colors[index % colors.length],
+        borderColor: CHART_COLORS[index % CHART_COLORS.length],
+        backgroundColor: CHART_COLORS[index % CHART_COLORS.length],
         tension: 0.2,
         pointRadius: timeframeDates.length < 10 ? 4 : timeframeDates.length < 20 ? 3 : 2,
       };
@@ -254,50 +302,6 @@ const Trends = () => {
     };
   };
   
-  // Chart options
-  const chartOptions = {
-    responsive: true,
-    maintainAspectRatio: false,
-    plugins: {
-      legend: {
-        position: 'top',
-      },
-      title: {
-        display: true,
-        text: 'Follower Count Trends',
-      },
-      tooltip: {
-        callbacks: {
-          label: function(context) {
-            let label = context.dataset.label || '';
-            if (label) {
-              label += ': ';
-            }
-            if (context.parsed.y !== null) {
-              label += new Intl.NumberFormat().format(context.parsed.y);
-            }
-            return label + ' followers';
-          }
-        }
-      }
-    },
-    scales: {
-      y: {
-        beginAtZero: false,
-        ticks: {
-          callback: function(value) {
-            if (value >= 1000000) {
-              return (value / 1000000).toFixed(1) + 'M';
-            } else if (value >= 1000) {
-              return (value / 1000).toFixed(1) + 'K';
-            }
-            return value;
-          }
-        }
-      }
-    },
-  };
-  
   // Calculate growth statistics based on selected timeframe
   const calculateGrowth = () => {
     if (!data || !data.trends || data.dates.length < 2) return [];
@@ -364,8 +368,9 @@ const Trends = () => {
     }
   };
   
-  // Growth stats cards
-  const growthStats = calculateGrowth();
+  // Growth stats cards, recomputed and re-sorted only when the data or timeframe
+  // changes rather than on every render (e.g. while typing in the account search)
+  const growthStats = useMemo(calculateGrowth, [data, timeframe]);
   const chartData = prepareChartData();
   
   return (
@@ -522,19 +527,13 @@ const Trends = () => {
                   : 'top 5 accounts by follower count'
                 } for ${timeframe === 'all' 
                   ? 'all available data' 
-                  : `the last ${
-                      timeframe === '6h' ? '6 hours' : 
-                      timeframe === '12h' ? '12 hours' : 
-                      timeframe === '1d' ? '24 hours' : 
-                      timeframe === '1w' ? '7 days' : 
-                      '30 days'
-                    }`
+                  : `the last ${TIMEFRAME_LABELS[timeframe]}`
                   }. ${selectedAccounts.length === 0 ? 'Search and add accounts above to customize the chart.' : ''}`
                 }
               </Alert>
               
               <Box sx={{ height: 400 }}>
-                {chartData && <Line options={chartOptions} data={chartData} />}
+                {chartData && <Line options={CHART_OPTIONS} data={chartData} />}
               </Box>
             </Box>
           </Paper>
@@ -546,13 +545,7 @@ const Trends = () => {
             <Typography variant="body2" color="text.secondary">
               {timeframe === 'all' 
                 ? 'All-time growth' 
-                : `Growth in the last ${
-                    timeframe === '6h' ? '6 hours' : 
-                    timeframe === '12h' ? '12 hours' : 
-                    timeframe === '1d' ? '24 hours' : 
-                    timeframe === '1w' ? '7 days' : 
-                    '30 days'
-                  }`
+                : `Growth in the last ${TIMEFRAME_LABELS[timeframe]}`
                 }
             </Typography>
           </Box>
@@ -9,6 +9,7 @@ import {
   USE_FETCH_FOR_DIRECT,
   FALLBACK_URLS
 } from '../config';
+import { DEBUG_LOGGING, debugLog } from '../utils/logger';
 
 // Determine if we're in development mode
 const isDev = process.env.NODE_ENV === 'development';
@@ -49,10 +50,10 @@ const logicApi = axios.create({
   timeout: 180000, // 3 minutes timeout
 });
 
-// Add request interceptor for logging
+// Add request interceptor for logging (request tracing is debug-only)
 api.interceptors.request.use(
   (config) => {
-    console.log(`API Request: ${config.method?.toUpperCase()} ${config.url}`);
+    debugLog(`API Request: ${config.method?.toUpperCase()} ${config.url}`);
     return config;
   },
   (error) => {
@@ -64,7 +65,7 @@ api.interceptors.request.use(
 // Add response interceptor for logging
 api.interceptors.response.use(
   (response) => {
-    console.log(`API Response: ${response.status} from ${response.config.url}`);
+    debugLog(`API Response: ${response.status} from ${response.config.url}`);
     return response;
   },
   (error) => {
@@ -80,7 +81,7 @@ api.interceptors.response.use(
 // Add similar interceptors for Logic Service API calls
 logicApi.interceptors.request.use(
   (config) => {
-    console.log(`Logic API Request: ${config.method?.toUpperCase()} ${config.url}`);
+    debugLog(`Logic API Request: ${config.method?.toUpperCase()} ${config.url}`);
     return config;
   },
   (error) => {
@@ -91,7 +92,7 @@ logicApi.interceptors.request.use(
 
 logicApi.interceptors.response.use(
   (response) => {
-    console.log(`Logic API Response: ${response.status} from ${response.config.url}`);
+    debugLog(`Logic API Response: ${response.status} from ${response.config.url}`);
     return response;
   },
   (error) => {
@@ -104,19 +105,37 @@ logicApi.interceptors.response.use(
   }
 );
 
-// Helper function to format Logic Service data to our expected format
-const formatProfileData = (serviceProfiles) => {
-  // Format the data to match our expected structure
-  // The Logic Service returns an array of profiles directly
-  const formattedData = {
-    leaderboard: serviceProfiles.map((profile, index) => ({
+// Map raw Logic Service profiles onto the leaderboard shape
+// Usernames are case-insensitive, so only the first entry per username is kept;
+// duplicates would otherwise render twice and collide as React keys
+const toLeaderboardProfiles = (serviceProfiles) => {
+  const seenUsernames = new Set();
+  const profiles = [];
+  
+  for (const profile of serviceProfiles) {
+    const usernameKey = profile.username?.toLowerCase();
+    if (!usernameKey || seenUsernames.has(usernameKey)) continue;
+    seenUsernames.add(usernameKey);
+    
+    profiles.push({
       username: profile.username,
       bio: profile.biography || '',
       follower_count: profile.follower_count,
       profile_img_url: profile.profile_pic_url,
       follower_change: 0, // Will be enhanced with analytics data separately
-      rank: index + 1
-    })),
+      rank: profiles.length + 1
+    });
+  }
+  
+  return profiles;
+};
+
+// Helper function to format Logic Service data to our expected format
+const formatProfileData = (serviceProfiles) => {
+  // Format the data to match our expected structure
+  // The Logic Service returns an array of profiles directly
+  const formattedData = {
+    leaderboard: toLeaderboardProfiles(serviceProfiles),
     updated_at: new Date().toISOString()
   };
   
@@ -124,9 +143,66 @@ const formatProfileData = (serviceProfiles) => {
   return formattedData;
 };
 
+// Requests to the Logic Service that are still in flight, keyed by path
+const inFlightRequests = new Map();
+
+// Recent successful Logic Service responses, keyed by path, reused for a short
+// time so pages and components loading together share one download
+const RESPONSE_CACHE_TTL = 15 * 1000; // 15 seconds
+const responseCache = new Map();
+
 // Helper function to try multiple URLs until one works
-const tryMultipleUrls = async (path, options = {}) => {
+// Concurrent callers asking for the same path share a single request, and a
+// recent response is reused unless forceRefresh is set
+const tryMultipleUrls = (path, options = {}, forceRefresh = false) => {
+  const cached = responseCache.get(path);
+  if (!forceRefresh && cached && Date.now() - cached.fetchedAt < RESPONSE_CACHE_TTL) {
+    return Promise.resolve(cached.result);
+  }
+  
+  if (!inFlightRequests.has(path)) {
+    const request = fetchFromFirstAvailableUrl(path, options)
+      .then(result => {
+        responseCache.set(path, { result, fetchedAt: Date.now() });
+        return result;
+      })
+      .finally(() => inFlightRequests.delete(path));
+    inFlightRequests.set(path, request);
+  }
+  return inFlightRequests.get(path);
+};
+
+// Hostnames that keep plain HTTP for local development. Matched against the
+// parsed hostname so hosts like "localhost.example.com" are still upgraded
+const LOCAL_HOSTNAMES = new Set(['localhost', '127.0.0.1']);
+const secureBaseUrls = new Map();
+
+// Upgrade a base URL to HTTPS unless it points at a local host
+const toSecureBaseUrl = (baseUrl) => {
+  if (!secureBaseUrls.has(baseUrl)) {
+    let hostname = '';
+    try {
+      hostname = new URL(baseUrl).hostname;
+    } catch (e) {
+      // Relative base URLs have no scheme to upgrade
+    }
+    secureBaseUrls.set(
+      baseUrl,
+      LOCAL_HOSTNAMES.has(hostname) ? baseUrl : baseUrl.replace('http:', 'https:')
+    );
+  }
+  return secureBaseUrls.get(baseUrl);
+};
+
+// Base URLs that recently failed at the network level, mapped to the time they
+// may be tried again. Checked even on forced refreshes, so a service that is
+// down costs one timeout per window rather than one per request
+const UNREACHABLE_RETRY_DELAY = 30 * 1000; // 30 seconds
+const unreachableUntil = new Map();
+
+const fetchFromFirstAvailableUrl = async (path, options = {}) => {
   const errors = [];
+  const now = Date.now();
   
   // First try the configured URL
   const urlsToTry = [
@@ -135,15 +211,17 @@ const tryMultipleUrls = async (path, options = {}) => {
   ];
   
   for (const baseUrl of urlsToTry) {
+    // Skip URLs that failed to connect within the last retry window
+    if (unreachableUntil.get(baseUrl) > now) {
+      errors.push({ url: baseUrl, error: 'Skipped: recently unreachable' });
+      continue;
+    }
+    
     try {
       // Ensure HTTPS is used, but preserve localhost HTTP for development
-      let secureBaseUrl = baseUrl;
-      if (!baseUrl.includes('localhost') && !baseUrl.includes('127.0.0.1')) {
-        // Only force HTTPS for non-localhost URLs
-        secureBaseUrl = baseUrl.replace('http:', 'https:');
-      }
+      const secureBaseUrl = toSecureBaseUrl(baseUrl);
       const fullUrl = `${secureBaseUrl}${path}`;
-      console.log(`Trying URL: ${fullUrl}`);
+      debugLog(`Trying URL: ${fullUrl}`);
       
       // Try with multiple fetch configurations 
       let response;
@@ -152,7 +230,7 @@ const tryMultipleUrls = async (path, options = {}) => {
         // First try standard CORS mode
         response = await fetch(fullUrl, {
           method: 'GET',
-          cache: 'no-store',
+          cache: 'no-cache', // Revalidate (ETag/304) instead of bypassing the HTTP cache
           headers: { 
             'Accept': 'application/json',
             'Origin': window.location.origin
@@ -168,7 +246,7 @@ const tryMultipleUrls = async (path, options = {}) => {
         // If CORS fails, try no-cors as last resort (will provide opaque response)
         response = await fetch(fullUrl, {
           method: 'GET',
-          cache: 'no-store',
+          cache: 'no-cache',
           headers: { 'Accept': 'application/json' },
           mode: 'no-cors', // Last resort mode
           credentials: 'omit',
@@ -197,11 +275,17 @@ const tryMultipleUrls = async (path, options = {}) => {
         }
       }
       
-      console.log(`Successfully connected to ${secureBaseUrl}`);
+      debugLog(`Successfully connected to ${secureBaseUrl}`);
+      unreachableUntil.delete(baseUrl);
       return { data, url: secureBaseUrl };
     } catch (error) {
       console.log(`Failed to connect to ${baseUrl}: ${error.message}`);
       errors.push({ url: baseUrl, error: error.message });
+      
+      // Network failures and timeouts mean the host is down, not just this path
+      if (error.name === 'TypeError' || error.name === 'TimeoutError' || error.name === 'AbortError') {
+        unreachableUntil.set(baseUrl, Date.now() + UNREACHABLE_RETRY_DELAY);
+      }
     }
   }
   
@@ -323,7 +407,7 @@ export const fetchProfileAnalytics = async (username) => {
       // First try the proxy URL
       await axios.get(`${LOGIC_URL}/health`);
       baseUrl = LOGIC_URL;
-      console.log(`Using proxy URL ${baseUrl} for analytics`);
+      debugLog(`Using proxy URL ${baseUrl} for analytics`);
     } catch (proxyError) {
       // If that fails, try the direct URL
       console.log(`Logic service proxy not available, using direct URL`);
@@ -334,18 +418,18 @@ export const fetchProfileAnalytics = async (username) => {
     baseUrl = baseUrl.replace('http:', 'https:');
     
     // Make parallel requests to Logic Service for different analytics
-    console.log(`Making parallel analytics requests to ${baseUrl} for ${username}`);
+    debugLog(`Making parallel analytics requests to ${baseUrl} for ${username}`);
     
     let growthResponse, changesResponse, rollingAvgResponse;
     
     if (USE_FETCH_FOR_DIRECT) {
       // Use fetch API to avoid SSL handshake issues
-      console.log(`Using fetch API for analytics to avoid SSL handshake issues`);
+      debugLog(`Using fetch API for analytics to avoid SSL handshake issues`);
       
       const [growthFetch, changesFetch, rollingAvgFetch] = await Promise.all([
         fetch(`${baseUrl}/api/v1/analytics/growth/${username}`, { 
           method: 'GET',
-          cache: 'no-store',
+          cache: 'no-cache', // Revalidate (ETag/304) instead of bypassing the HTTP cache
           headers: { 'Accept': 'application/json' },
           mode: 'cors',
           credentials: 'omit',
@@ -353,7 +437,7 @@ export const fetchProfileAnalytics = async (username) => {
         }),
         fetch(`${baseUrl}/api/v1/analytics/changes/${username}`, { 
           method: 'GET',
-          cache: 'no-store',
+          cache: 'no-cache',
           headers: { 'Accept': 'application/json' },
           mode: 'cors',
           credentials: 'omit',
@@ -361,7 +445,7 @@ export const fetchProfileAnalytics = async (username) => {
         }),
         fetch(`${baseUrl}/api/v1/analytics/rolling-average/${username}`, { 
           method: 'GET',
-          cache: 'no-store',
+          cache: 'no-cache',
           headers: { 'Accept': 'application/json' },
           mode: 'cors',
           credentials: 'omit',
@@ -459,10 +543,45 @@ const enhanceProfilesWithAnalytics = async (profiles) => {
   return enhancedProfiles;
 };
 
+// When a scrape was last requested from this client, and how long afterwards
+// forced refreshes also add a unique cache-busting parameter, so responses
+// served while the scrape is still running are never reused from any cache
+let lastScrapeRequestedAt = 0;
+const SCRAPE_CACHE_BUST_WINDOW = 30 * 1000; // 30 seconds
+
+// Request config for the backend API calls. Forced refreshes always ask caches
+// to revalidate; only those shortly after a scrape also use a unique URL
+const forcedRefreshConfig = (forceRefresh) => {
+  if (!forceRefresh) return {};
+  
+  const config = { headers: { 'Cache-Control': 'no-cache' } };
+  if (Date.now() - lastScrapeRequestedAt < SCRAPE_CACHE_BUST_WINDOW) {
+    config.params = { _t: Date.now() };
+  }
+  return config;
+};
+
+// Log follower change stats for debugging in a single pass over the profiles
+// (skipped entirely unless debug logging is enabled)
+const logFollowerChangeStats = (profiles) => {
+  if (!DEBUG_LOGGING) return;
+  
+  let changesCount = 0;
+  const examples = [];
+  
+  profiles.forEach((profile, index) => {
+    if (profile.follower_change !== 0) changesCount++;
+    if (index < 3) examples.push(`${profile.username}: ${profile.follower_change}`);
+  });
+  
+  console.log(`Leaderboard data contains ${profiles.length} profiles, ${changesCount} with non-zero follower changes`);
+  console.log(`Example follower changes: ${examples.join(', ')}`);
+};
+
 export const fetchLeaderboard = async (forceRefresh = false) => {
   try {
-    // Add a cache busting parameter when force refresh is requested
-    const params = forceRefresh ? { _t: Date.now() } : {};
+    // Forced refreshes revalidate, and bypass caches right after a scrape
+    const requestConfig = forcedRefreshConfig(forceRefresh);
     
     try {
       // First try using the Logic Service to get profiles
@@ -476,7 +595,7 @@ export const fetchLeaderboard = async (forceRefresh = false) => {
           
           try {
             // Use our helper to try multiple URLs until one works
-            const result = await tryMultipleUrls('/api/v1/profiles');
+            const result = await tryMultipleUrls('/api/v1/profiles', {}, forceRefresh);
             
             // Convert the response to the same format axios would return
             logicProfilesResponse = { data: result.data };
@@ -499,41 +618,29 @@ export const fetchLeaderboard = async (forceRefresh = false) => {
         
         if (Array.isArray(logicProfilesResponse.data) && logicProfilesResponse.data.length > 0) {
           // Format and enhance profiles with analytics data
-          const formattedProfiles = logicProfilesResponse.data.map((profile, index) => ({
-            username: profile.username,
-            bio: profile.biography || '',
-            follower_count: profile.follower_count,
-            profile_img_url: profile.profile_pic_url,
-            follower_change: 0, // Will be replaced with actual data
-            rank: index + 1
-          }));
+          const formattedProfiles = toLeaderboardProfiles(logicProfilesResponse.data);
           
           // Skip the analytics enhancement for now since it's causing errors
           // Just use the basic profile data
           console.log('Skipping analytics enhancement due to connection issues');
-          const enhancedProfiles = formattedProfiles.map(profile => ({
-            ...profile,
-            follower_change: 0,
-            twelve_hour_change: 0,
-            twenty_four_hour_change: 0,
-            seven_day_average: 0
-          }));
+          
+          // The formatted profiles are fresh objects owned by this call, so the
+          // growth defaults and ranks are set in place rather than via copies
+          formattedProfiles.forEach(profile => {
+            profile.follower_change = 0;
+            profile.twelve_hour_change = 0;
+            profile.twenty_four_hour_change = 0;
+            profile.seven_day_average = 0;
+          });
           
           // Sort by follower count (descending) and update ranks
-          const sortedProfiles = enhancedProfiles
-            .sort((a, b) => b.follower_count - a.follower_count)
-            .map((profile, index) => ({
-              ...profile,
-              rank: index + 1
-            }));
+          const sortedProfiles = formattedProfiles.sort((a, b) => b.follower_count - a.follower_count);
+          sortedProfiles.forEach((profile, index) => {
+            profile.rank = index + 1;
+          });
           
           // Log follower change stats for debugging
-          const changesCount = sortedProfiles.filter(p => p.follower_change !== 0).length;
-          console.log(`Leaderboard data contains ${sortedProfiles.length} profiles, ${changesCount} with non-zero follower changes`);
-          
-          // Log a few examples of follower changes for debugging
-          const examples = sortedProfiles.slice(0, 3).map(p => `${p.username}: ${p.follower_change}`);
-          console.log(`Example follower changes: ${examples.join(', ')}`);
+          logFollowerChangeStats(sortedProfiles);
           
           return {
             leaderboard: sortedProfiles,
@@ -556,17 +663,11 @@ export const fetchLeaderboard = async (forceRefresh = false) => {
       }
       
       // Fallback to the standard API endpoint
-      const response = await api.get(API_ENDPOINTS.leaderboard, { params });
+      const response = await api.get(API_ENDPOINTS.leaderboard, requestConfig);
       
       // Log follower change stats for debugging
       if (response.data && response.data.leaderboard) {
-        const profiles = response.data.leaderboard;
-        const changesCount = profiles.filter(p => p.follower_change !== 0).length;
-        console.log(`Leaderboard data contains ${profiles.length} profiles, ${changesCount} with non-zero follower changes`);
-        
-        // Log a few examples of follower changes for debugging
-        const examples = profiles.slice(0, 3).map(p => `${p.username}: ${p.follower_change}`);
-        console.log(`Example follower changes: ${examples.join(', ')}`);
+        logFollowerChangeStats(response.data.leaderboard);
       }
       
       return response.data;
@@ -581,7 +682,7 @@ export const fetchLeaderboard = async (forceRefresh = false) => {
         
         try {
           // Make one final attempt using our helper function
-          const result = await tryMultipleUrls('/api/v1/profiles', { timeout: 15000 });
+          const result = await tryMultipleUrls('/api/v1/profiles', { timeout: 15000 }, forceRefresh);
           
           // Convert to expected format
           finalResponse = { data: result.data };
@@ -596,14 +697,7 @@ export const fetchLeaderboard = async (forceRefresh = false) => {
           console.log(`Final attempt successful! Received ${finalResponse.data.length} profiles`);
           
           // Format the profiles for the leaderboard
-          const formattedProfiles = finalResponse.data.map((profile, index) => ({
-            username: profile.username,
-            bio: profile.biography || '',
-            follower_count: profile.follower_count,
-            profile_img_url: profile.profile_pic_url,
-            follower_change: 0, // Will be replaced with analytics data
-            rank: index + 1
-          }));
+          const formattedProfiles = toLeaderboardProfiles(finalResponse.data);
           
           return {
             leaderboard: formattedProfiles,
@@ -632,85 +726,85 @@ export const fetchLeaderboard = async (forceRefresh = false) => {
   }
 };
 
-// Mock trend data
-const MOCK_TRENDS = [
-  {
-    username: 'lilmiquela',
-    follower_counts: [3050000, 3075300, 3095800, 3110200, 3127450],
-    timestamps: [
-      new Date(Date.now() - 4 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 3 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 2 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 1 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date().toISOString()
-    ]
-  },
-  {
-    username: 'imma.gram',
-    follower_counts: [1485300, 1496800, 1510500, 1521200, 1528963],
-    timestamps: [
-      new Date(Date.now() - 4 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 3 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 2 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 1 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date().toISOString()
-    ]
-  },
-  {
-    username: 'shudu.gram',
-    follower_counts: [812400, 824500, 833200, 840100, 842759],
-    timestamps: [
-      new Date(Date.now() - 4 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 3 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 2 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 1 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date().toISOString()
-    ]
-  },
-  {
-    username: 'noonoouri',
-    follower_counts: [720350, 725800, 731500, 736300, 738952],
-    timestamps: [
-      new Date(Date.now() - 4 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 3 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 2 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 1 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date().toISOString()
-    ]
-  },
-  {
-    username: 'knox.frost',
-    follower_counts: [635200, 641500, 647800, 651300, 653124],
-    timestamps: [
-      new Date(Date.now() - 4 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 3 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 2 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date(Date.now() - 1 * 24 * 60 * 60 * 1000).toISOString(),
-      new Date().toISOString()
-    ]
+// Compare history points by parsed time, oldest first. Points whose timestamp
+// cannot be parsed sort after all valid ones, so the comparator stays
+// consistent instead of returning NaN
+const compareParsedTimes = (a, b) => {
+  const aInvalid = Number.isNaN(a.time);
+  const bInvalid = Number.isNaN(b.time);
+  if (aInvalid || bInvalid) {
+    return aInvalid - bInvalid;
   }
-];
+  return a.time - b.time;
+};
 
-// Generate date labels for the past 5 days
-const MOCK_DATES = [
-  new Date(Date.now() - 4 * 24 * 60 * 60 * 1000).toLocaleDateString('en-US', { month: 'short', day: 'numeric' }),
-  new Date(Date.now() - 3 * 24 * 60 * 60 * 1000).toLocaleDateString('en-US', { month: 'short', day: 'numeric' }),
-  new Date(Date.now() - 2 * 24 * 60 * 60 * 1000).toLocaleDateString('en-US', { month: 'short', day: 'numeric' }),
-  new Date(Date.now() - 1 * 24 * 60 * 60 * 1000).toLocaleDateString('en-US', { month: 'short', day: 'numeric' }),
-  new Date().toLocaleDateString('en-US', { month: 'short', day: 'numeric' })
+// Mock trend data: follower counts for each mock account over the past 5 days
+const MOCK_TREND_COUNTS = [
+  ['lilmiquela', [3050000, 3075300, 3095800, 3110200, 3127450]],
+  ['imma.gram', [1485300, 1496800, 1510500, 1521200, 1528963]],
+  ['shudu.gram', [812400, 824500, 833200, 840100, 842759]],
+  ['noonoouri', [720350, 725800, 731500, 736300, 738952]],
+  ['knox.frost', [635200, 641500, 647800, 651300, 653124]]
 ];
+const MOCK_TREND_DAYS = 5;
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Shared formatter for chart date labels (e.g. "Jan 5"); building one formatter up
+// front avoids toLocaleDateString setting up locale data for every timestamp
+const DATE_LABEL_FORMAT = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' });
+
+// Format a timestamp as a date label. Intl throws on invalid dates, so those
+// keep the "Invalid Date" label toLocaleDateString produced rather than
+// aborting the whole trends fetch
+const formatDateLabel = (value) => {
+  const time = new Date(value).getTime();
+  return Number.isNaN(time) ? 'Invalid Date' : DATE_LABEL_FORMAT.format(time);
+};
+
+// Build the mock trends and their date labels from a single set of day offsets,
+// so the clock is read once and each timestamp is formatted once
+const buildMockTrendsData = () => {
+  const now = Date.now();
+  const timestamps = [];
+  const dates = [];
+  for (let daysAgo = MOCK_TREND_DAYS - 1; daysAgo >= 0; daysAgo--) {
+    const time = now - daysAgo * DAY_MS;
+    timestamps.push(new Date(time).toISOString());
+    dates.push(DATE_LABEL_FORMAT.format(time));
+  }
+  
+  return {
+    trends: MOCK_TREND_COUNTS.map(([username, followerCounts]) => ({
+      username,
+      follower_counts: followerCounts,
+      timestamps
+    })),
+    dates
+  };
+};
+
+// Mock trends are only needed when every source fails, so they are built on
+// first use instead of at import time, then reused for later fallbacks
+let mockTrendsData = null;
+
+const getMockTrendsData = () => {
+  if (!mockTrendsData) {
+    mockTrendsData = buildMockTrendsData();
+  }
+  return mockTrendsData;
+};
 
 export const fetchTrends = async (forceRefresh = false) => {
   try {
-    // Add a cache busting parameter when force refresh is requested
-    const params = forceRefresh ? { _t: Date.now() } : {};
+    // Forced refreshes revalidate, and bypass caches right after a scrape
+    const requestConfig = forcedRefreshConfig(forceRefresh);
     
     try {
       // First try using the Logic Service to get history for all profiles
       try {
         // Get all accounts from Logic Service using our helper
         console.log('Fetching accounts from Logic Service');
-        const accountsResult = await tryMultipleUrls('/api/v1/accounts');
+        const accountsResult = await tryMultipleUrls('/api/v1/accounts', {}, forceRefresh);
         const accounts = accountsResult.data;
         const baseUrl = accountsResult.url;
         
@@ -722,14 +816,11 @@ export const fetchTrends = async (forceRefresh = false) => {
             accounts.map(async (account) => {
               try {
                 // Try direct fetch with CORS settings, ensuring HTTPS
-                let secureBaseUrl = baseUrl;
-                if (!baseUrl.includes('localhost') && !baseUrl.includes('127.0.0.1')) {
-                  secureBaseUrl = baseUrl.replace('http:', 'https:');
-                }
+                const secureBaseUrl = toSecureBaseUrl(baseUrl);
                 const historyUrl = `${secureBaseUrl}/api/v1/profiles/history/${account.username}`;
                 const response = await fetch(historyUrl, {
                   method: 'GET',
-                  cache: 'no-store',
+                  cache: 'no-cache', // Revalidate (ETag/304) instead of bypassing the HTTP cache
                   headers: { 'Accept': 'application/json' },
                   mode: 'cors',
                   credentials: 'omit',
@@ -743,8 +834,20 @@ export const fetchTrends = async (forceRefresh = false) => {
                 const historyData = await response.json();
                 
                 if (historyData && historyData.history) {
-                  // Format the history data
-                  const history = historyData.history;
+                  // Format the history data, ordered oldest to newest once here so
+                  // consumers can rely on the order. Timestamps are parsed once and
+                  // both the order check and the sort use the parsed times, so
+                  // mixed UTC offsets compare correctly; sort only if out of order
+                  let history = historyData.history;
+                  const parsedHistory = history.map(point => ({ point, time: Date.parse(point.timestamp) }));
+                  const isChronological = parsedHistory.every(
+                    (entry, index) => index === 0 || compareParsedTimes(parsedHistory[index - 1], entry) <= 0
+                  );
+                  if (!isChronological) {
+                    history = parsedHistory
+                      .sort(compareParsedTimes)
+                      .map(({ point }) => point);
+                  }
                   
                   // Extract dates and follower counts into separate arrays
                   const timestamps = history.map(point => point.timestamp);
@@ -771,9 +874,7 @@ export const fetchTrends = async (forceRefresh = false) => {
             // Generate date labels from the timestamps of the first profile
             // (assuming all profiles have similar timestamp patterns)
             const sampleTimestamps = validTrends[0].timestamps;
-            const dates = sampleTimestamps.map(ts => 
-              new Date(ts).toLocaleDateString('en-US', { month: 'short', day: 'numeric' })
-            );
+            const dates = sampleTimestamps.map(formatDateLabel);
             
             console.log(`Successfully fetched trend data for ${validTrends.length} profiles from Logic Service`);
             
@@ -788,10 +889,10 @@ export const fetchTrends = async (forceRefresh = false) => {
       }
       
       // Fallback to standard API endpoint
-      const response = await api.get(API_ENDPOINTS.trends, { params });
+      const response = await api.get(API_ENDPOINTS.trends, requestConfig);
       
-      // Log trend data stats for debugging
-      if (response.data && response.data.trends) {
+      // Log trend data stats for debugging (the extra pass is skipped in production)
+      if (DEBUG_LOGGING && response.data && response.data.trends) {
         console.log(`Received trends data for ${response.data.trends.length} profiles`);
         
         // Check if we have follower_counts arrays with actual data
@@ -807,22 +908,25 @@ export const fetchTrends = async (forceRefresh = false) => {
       console.error('Error fetching trends, using mock data:', error);
       
       // Return mock data when API fails
-      return { 
-        trends: MOCK_TRENDS, 
-        dates: MOCK_DATES 
-      };
+      return getMockTrendsData();
     }
   } catch (error) {
     console.error('Error in fetchTrends, using mock data:', error);
     
     // Return mock data as fallback
-    return { 
-      trends: MOCK_TRENDS, 
-      dates: MOCK_DATES 
-    };
+    return getMockTrendsData();
   }
 };
 
+// Shared react-query options for the 'trends' query so every consumer agrees on
+// freshness. Cached trends are kept for 30 minutes after the last observer
+// unmounts and served immediately while one background refetch replaces them.
+export const TRENDS_QUERY_OPTIONS = {
+  staleTime: 5 * 60 * 1000, // 5 minutes
+  cacheTime: 30 * 60 * 1000, // 30 minutes
+  refetchOnWindowFocus: false,
+};
+
 // Test endpoints for follower growth testing
 export const fetchTestData = async () => {
   try {
@@ -868,6 +972,14 @@ export const fetchAccounts = async () => {
   }
 };
 
+// Ask the backend to start a new scrape, through the shared API client so the
+// request reuses its configuration and open connection
+export const requestScrape = async () => {
+  const response = await api.post(API_ENDPOINTS.scrape);
+  lastScrapeRequestedAt = Date.now();
+  return response.data;
+};
+
 export const submitAccount = async (username, submitter = 'Anonymous') => {
   try {
     const response = await api.post(API_ENDPOINTS.submit, { username, submitter });
@@ -885,12 +997,18 @@ export const submitAccount = async (username, submitter = 'Anonymous') => {
   }
 };
 
-// Mock pending accounts data
-const MOCK_PENDING_ACCOUNTS = [
-  { username: 'ai_influencer_2025', submitter: 'john_doe', submitted_at: new Date(Date.now() - 2 * 24 * 60 * 60 * 1000).toISOString() },
-  { username: 'digital_avatar_official', submitter: 'marketing_team', submitted_at: new Date(Date.now() - 1.5 * 24 * 60 * 60 * 1000).toISOString() },
-  { username: 'virtual_persona', submitter: 'ai_enthusiast', submitted_at: new Date(Date.now() - 1 * 24 * 60 * 60 * 1000).toISOString() }
+// Mock pending accounts data, built once at import from a single clock read
+const MOCK_PENDING_SUBMISSIONS = [
+  ['ai_influencer_2025', 'john_doe', 2],
+  ['digital_avatar_official', 'marketing_team', 1.5],
+  ['virtual_persona', 'ai_enthusiast', 1]
 ];
+const mockSubmittedFrom = Date.now();
+const MOCK_PENDING_ACCOUNTS = MOCK_PENDING_SUBMISSIONS.map(([username, submitter, daysAgo]) => ({
+  username,
+  submitter,
+  submitted_at: new Date(mockSubmittedFrom - daysAgo * DAY_MS).toISOString()
+}));
 
 // Admin API endpoints
 export const fetchPendingAccounts = async () => {
@@ -922,7 +1040,8 @@ export const approveAccount = async (username) => {
     return { 
       success: true, 
       message: `Account ${username} approved (demo mode)`,
-      username: username 
+      username: username,
+      demo: true  // The server was not reached, so nothing actually changed
     };
   }
 };
@@ -936,7 +1055,8 @@ export const rejectAccount = async (username) => {
     return { 
       success: true, 
       message: `Account ${username} rejected (demo mode)`,
-      username: username 
+      username: username,
+      demo: true  // The server was not reached, so nothing actually changed
     };
   }
 };
@@ -950,7 +1070,8 @@ export const removeAccount = async (username) => {
     return { 
       success: true, 
       message: `Account ${username} removed (demo mode)`,
-      username: username 
+      username: username,
+      demo: true  // The server was not reached, so nothing actually changed
     };
   }
 };
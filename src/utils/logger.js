@@ -0,0 +1,21 @@
+/**
+ * Logging helpers for the frontend
+ *
+ * Debug output is only emitted in development or when REACT_APP_DEBUG_LOGS is
+ * enabled, so per-request and per-profile logging stays out of production builds.
+ */
+
+// Resolved once at load time so each call site only pays for a boolean check
+export const DEBUG_LOGGING = process.env.NODE_ENV === 'development' ||
+                             process.env.REACT_APP_DEBUG_LOGS === 'true' ||
+                             (window._env_ && window._env_.REACT_APP_DEBUG_LOGS === 'true');
+
+/**
+ * Log a message only when debug logging is enabled
+ * @param {...any} args - Values passed through to console.log
+ */
+export const debugLog = (...args) => {
+  if (DEBUG_LOGGING) {
+    console.log(...args);
+  }
+};